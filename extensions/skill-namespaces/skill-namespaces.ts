@@ -16,7 +16,7 @@
  */
 
 import type { ExtensionAPI } from "@mariozechner/pi-coding-agent";
-import { readdirSync, readFileSync, existsSync } from "node:fs";
+import { readdirSync, readFileSync, type Dirent } from "node:fs";
 import { join, basename } from "node:path";
 
 const ALLOWED_NAMESPACES = new Set([
@@ -42,42 +42,51 @@ function parseSkillFrontmatter(content: string): { name?: string; description?:
 
 function discoverSkills(skillsDir: string): SkillInfo[] {
 	const skills: SkillInfo[] = [];
-	if (!existsSync(skillsDir)) return skills;
 
 	const scanDir = (dir: string, namespace: string | null) => {
-		let entries: string[];
+		let entries: Dirent[];
 		try {
-			entries = readdirSync(dir);
+			// Typed entries come straight from readdir, so plain files can be
+			// skipped without probing them for a SKILL.md.
+			entries = readdirSync(dir, { withFileTypes: true });
 		} catch {
 			return;
 		}
 
-		for (const entry of entries) {
+		for (const dirent of entries) {
+			if (!dirent.isDirectory() && !dirent.isSymbolicLink()) continue;
+			// Hidden directories (.git, caches) never hold skills
+			if (dirent.name.startsWith(".")) continue;
+
+			const entry = dirent.name;
 			const entryPath = join(dir, entry);
 			const skillFile = join(entryPath, "SKILL.md");
 
-			if (existsSync(skillFile)) {
-				// This is a skill directory
-				try {
-					const content = readFileSync(skillFile, "utf-8");
-					const fm = parseSkillFrontmatter(content);
-					const name = fm.name || basename(entryPath);
-					skills.push({
-						name,
-						description: fm.description || `Skill: ${name}`,
-						namespace,
-						path: skillFile,
-					});
-				} catch {
-					// Skip unreadable skills
-				}
-			} else {
+			// Read SKILL.md directly rather than probing with existsSync first
+			let content: string;
+			try {
+				content = readFileSync(skillFile, "utf-8");
+			} catch (err) {
+				const code = (err as NodeJS.ErrnoException).code;
+				if (code !== "ENOENT" && code !== "ENOTDIR") continue; // Skip unreadable skills
+
 				// Check if this is a namespace directory (contains subdirs with SKILL.md)
 				const candidateNamespace = ALLOWED_NAMESPACES.has(entry) ? entry : null;
 				if (candidateNamespace) {
 					scanDir(entryPath, candidateNamespace);
 				}
+				continue;
 			}
+
+			// This is a skill directory
+			const fm = parseSkillFrontmatter(content);
+			const name = fm.name || basename(entryPath);
+			skills.push({
+				name,
+				description: fm.description || `Skill: ${name}`,
+				namespace,
+				path: skillFile,
+			});
 		}
 	};
 
@@ -27,10 +27,6 @@ export interface AgentDiscoveryResult {
 function loadAgentsFromDir(dir: string, source: "user" | "project"): AgentConfig[] {
 	const agents: AgentConfig[] = [];
 
-	if (!fs.existsSync(dir)) {
-		return agents;
-	}
-
 	let entries: fs.Dirent[];
 	try {
 		entries = fs.readdirSync(dir, { withFileTypes: true });
@@ -43,10 +43,6 @@ function parseFrontmatter(content: string): { frontmatter: ParsedFrontmatter; bo
 function loadPromptsFromDir(dir: string): PromptConfig[] {
 	const prompts: PromptConfig[] = [];
 
-	if (!fs.existsSync(dir)) {
-		return prompts;
-	}
-
 	let entries: fs.Dirent[];
 	try {
 		entries = fs.readdirSync(dir, { withFileTypes: true });
@@ -4,12 +4,9 @@
 import argparse
 import json
 import os
-import shutil
 import socket
-import subprocess
 import sys
 import time
-import uuid
 from contextlib import suppress
 from pathlib import Path
 from typing import Any
@@ -32,6 +29,8 @@ def get_socket_path(task_id: str) -> Path:
 
 def ensure_pueue_group() -> None:
     """Ensure the pexpect group exists in pueue with adequate parallelism."""
+    import subprocess  # noqa: PLC0415
+
     result = subprocess.run(
         ["pueue", "group", "--json"],
         capture_output=True,
@@ -55,6 +54,8 @@ def ensure_pueue_group() -> None:
 
 def get_pueue_tasks() -> dict[str, Any]:
     """Get all pueue tasks as a dictionary."""
+    import subprocess  # noqa: PLC0415
+
     result = subprocess.run(
         ["pueue", "status", "--json"],
         capture_output=True,
@@ -67,6 +68,10 @@ def get_pueue_tasks() -> dict[str, Any]:
 
 def start_session(name: str | None = None) -> str:
     """Start new pexpect server session."""
+    import shutil  # noqa: PLC0415
+    import subprocess  # noqa: PLC0415
+    import uuid  # noqa: PLC0415
+
     server_path = shutil.which("pexpect-server")
     if not server_path:
         msg = "pexpect-server not found in PATH"
@@ -117,13 +122,14 @@ def exec_in_session(session_id: str, code: str) -> None:
     """Execute code in existing session."""
     sock_path = get_socket_path(session_id)
 
-    if not sock_path.exists():
-        print(f"Error: Session {session_id} not found at {sock_path}", file=sys.stderr)
-        sys.exit(1)
-
     sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
-        sock.connect(str(sock_path))
+        # Let connect() report a missing socket instead of stat-ing it first
+        try:
+            sock.connect(str(sock_path))
+        except FileNotFoundError:
+            print(f"Error: Session {session_id} not found at {sock_path}", file=sys.stderr)
+            sys.exit(1)
 
         request = json.dumps({"code": code})
         sock.sendall(request.encode())
@@ -154,6 +160,8 @@ def exec_in_session(session_id: str, code: str) -> None:
 
 def stop_session(session_id: str) -> None:
     """Stop session and cleanup socket."""
+    import subprocess  # noqa: PLC0415
+
     # Find the pueue task ID for this session
     data = get_pueue_tasks()
 
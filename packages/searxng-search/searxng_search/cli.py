@@ -16,10 +16,10 @@ CONFIG_PATH = Path.home() / ".config" / "searxng-search" / "config.json"
 
 
 def load_config() -> dict[str, Any]:
-    if not CONFIG_PATH.exists():
-        return {}
     try:
         return cast(dict[str, Any], json.loads(CONFIG_PATH.read_text()))
+    except FileNotFoundError:
+        return {}
     except Exception as exc:  # pragma: no cover - defensive path
         raise SystemExit(f"Failed to parse config file {CONFIG_PATH}: {exc}") from exc
 